@@ -1,5 +1,6 @@
 import asyncio
 import os
+import typing
 
 import velum
 
@@ -30,6 +31,26 @@ bot = velum.GatewayClient(
 )
 
 
+# Define some commands. Mapping the command names to their handlers in a dict
+# means finding the right handler for a message takes a single lookup, no matter
+# how many commands the bot has.
+
+
+async def pog() -> None:
+    await bot.rest.send_message("Pog!")
+
+
+async def velum_url() -> None:
+    await bot.rest.send_message(VELUM_URL)
+
+
+PREFIX = "!"
+COMMANDS: dict[str, typing.Callable[[], typing.Awaitable[None]]] = {
+    PREFIX + "pog": pog,
+    PREFIX + "velum": velum_url,
+}
+
+
 # Register a listener for messages.
 # The event type can be provided to the listener, or it can be automatically
 # resolved from the annotation of the first function parameter.
@@ -37,18 +58,14 @@ bot = velum.GatewayClient(
 
 @bot.listen()
 async def on_message(event: velum.MessageCreateEvent):
-    if event.author == bot.gateway.user:
+    # Most messages are not commands. Checking the prefix first is cheap and
+    # rejects those without having to hash their (potentially long) content.
+    if not event.content.startswith(PREFIX) or event.author == bot.gateway.user:
         return
 
-    match event.content:  # noqa: E999
-        case "!pog":
-            await bot.rest.send_message("Pog!")
-
-        case "!velum":
-            await bot.rest.send_message(VELUM_URL)
-
-        case _:
-            return
+    handler = COMMANDS.get(event.content)
+    if handler is not None:
+        await handler()
 
 
 # Start the client!
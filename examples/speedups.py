@@ -3,30 +3,33 @@
 # the performance of your client. This example will go over what to do to actually
 # opt into all the speedup features.
 
-import asyncio
 import os
+import typing
 
 import uvloop
 
 import velum
 
 # First and foremost, we will use orjson instead of the default json library.
-# This can easily achieved with a helper function provided by Velum.
+# Velum automatically does this if orjson is installed, but it can also be set
+# explicitly with a helper function provided by Velum.
 # Note that this will raise an `ImportError` if orjson is not installed.
 
 velum.set_json_impl(impl=velum.JSONImpl.ORJSON)
 
 
-# Next, and probably the most impactful, is uvloop. This only works on
-# Unix, and is therefore not installed with speedups if you are on a
-# different platform.
+# Next, we instantiate a client as per usual.
 
-uvloop.install()
+client = velum.GatewayClient(token=os.environ["TOKEN"])
 
 
-# Finally, we instantiate and run a client as per usual.
+async def speed() -> None:
+    await client.rest.send_message("I am the fast.")
 
-client = velum.GatewayClient(token=os.environ["TOKEN"])
+
+COMMANDS: dict[str, typing.Callable[[], typing.Awaitable[None]]] = {
+    "!speed": speed,
+}
 
 
 @client.listen()
@@ -34,12 +37,14 @@ async def on_message(event: velum.MessageCreateEvent):
     if event.author == client.gateway.user:
         return
 
-    match event.content:  # noqa: E999
-        case "!speed":
-            await client.rest.send_message("I am the fast.")
+    handler = COMMANDS.get(event.content)
+    if handler is not None:
+        await handler()
 
-        case _:
-            return
 
+# Finally, and probably the most impactful, is uvloop. This only works on
+# Unix, and is therefore not installed with speedups if you are on a
+# different platform. Instead of running the client through `asyncio.run`,
+# we run it through `uvloop.run`, which sets up a uvloop event loop for us.
 
-asyncio.run(client.start())
+uvloop.run(client.start())
@@ -1,5 +1,6 @@
 # TODO: Move meta info to its own file.
 
+import importlib
 import typing
 
 __title__: typing.Final[str] = "velum"
@@ -9,16 +10,90 @@ __copyright__: typing.Final[str] = "© 2022-present Chromosomologist"
 __version__: typing.Final[str] = "0.5.0"
 
 
-from velum import events as events
-from velum import traits as traits
-from velum.errors import *
-from velum.events import Event as Event
-from velum.events import ExceptionEvent as ExceptionEvent
-from velum.events.connection_events import *
-from velum.events.message_events import *
-from velum.files import *
-from velum.impl.client import GatewayClient as GatewayClient
-from velum.impl.rest import RESTClient as RESTClient
-from velum.internal.data_binding import JSONImpl as JSONImpl
-from velum.internal.data_binding import set_json_impl as set_json_impl
-from velum.models import *
+if typing.TYPE_CHECKING:
+    from velum import api as api
+    from velum import errors as errors
+    from velum import events as events
+    from velum import files as files
+    from velum import impl as impl
+    from velum import internal as internal
+    from velum import models as models
+    from velum import routes as routes
+    from velum import traits as traits
+    from velum.errors import *
+    from velum.events import Event as Event
+    from velum.events import ExceptionEvent as ExceptionEvent
+    from velum.events.connection_events import *
+    from velum.events.message_events import *
+    from velum.files import *
+    from velum.impl.client import GatewayClient as GatewayClient
+    from velum.impl.rest import RESTClient as RESTClient
+    from velum.internal.data_binding import JSONImpl as JSONImpl
+    from velum.internal.data_binding import set_json_impl as set_json_impl
+    from velum.models import *
+
+
+# Exported symbols are imported lazily upon first access (PEP 562), such that
+# importing velum does not immediately import every submodule (and aiohttp).
+
+_SUBMODULES: typing.Final[frozenset[str]] = frozenset(
+    ("api", "errors", "events", "files", "impl", "internal", "models", "routes", "traits"),
+)
+
+# Modules whose `__all__` is re-exported in its entirety. Names are looked up
+# in these in order, so cheaper imports go first.
+_STAR_EXPORTS: typing.Final[tuple[str, ...]] = (
+    "velum.errors",
+    "velum.models",
+    "velum.events.connection_events",
+    "velum.events.message_events",
+    "velum.files",
+)
+
+# Individual names re-exported from other modules.
+_NAMED_EXPORTS: typing.Final[dict[str, str]] = {
+    "Event": "velum.events",
+    "ExceptionEvent": "velum.events",
+    "GatewayClient": "velum.impl.client",
+    "RESTClient": "velum.impl.rest",
+    "JSONImpl": "velum.internal.data_binding",
+    "set_json_impl": "velum.internal.data_binding",
+}
+
+
+def _load(name: str) -> typing.Any:  # noqa: ANN401
+    if name == "__all__":
+        return (
+            *_SUBMODULES,
+            *(
+                export
+                for module_name in _STAR_EXPORTS
+                for export in importlib.import_module(module_name).__all__
+            ),
+            *_NAMED_EXPORTS,
+        )
+
+    if name in _SUBMODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+
+    if name in _NAMED_EXPORTS:
+        return getattr(importlib.import_module(_NAMED_EXPORTS[name]), name)
+
+    for module_name in _STAR_EXPORTS:
+        module = importlib.import_module(module_name)
+        if name in module.__all__:
+            return getattr(module, name)
+
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
+
+
+def __getattr__(name: str) -> typing.Any:  # noqa: ANN401
+    value = _load(name)
+    # Cache the value such that __getattr__ is only hit once per name.
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return [*(name for name in globals() if name.startswith("__")), *__getattr__("__all__")]
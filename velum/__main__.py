@@ -1,8 +1,10 @@
-import argparse
 import asyncio
+import sys
 
 import velum
 
+_USAGE = "usage: velum [--url URL] username-or-email password"
+
 
 async def create_password(username: str, password: str, url: str | None) -> str:
     async with velum.RESTClient(rest_url=url) as client:
@@ -13,17 +15,38 @@ async def create_password(username: str, password: str, url: str | None) -> str:
         return token
 
 
-def main() -> None:
-    parser = argparse.ArgumentParser(prog="velum")
-    parser.add_argument("username-or-email")
-    parser.add_argument("password")
-    parser.add_argument("--url", "-U", default=None)
+def _parse_args(argv: list[str]) -> tuple[str, str, str | None]:
+    # Parsed manually as importing argparse is relatively slow for such a
+    # simple command line interface.
+    url = None
+    positionals: list[str] = []
+
+    args = iter(argv)
+    for arg in args:
+        if arg in ("--url", "-U"):
+            url = next(args, None)
+            if url is None:
+                sys.exit(f"{_USAGE}\nvelum: error: argument --url/-U: expected one argument")
+
+        elif arg.startswith("--url="):
+            url = arg.removeprefix("--url=")
+
+        elif arg in ("--help", "-h"):
+            print(_USAGE)
+            sys.exit(0)
 
-    args = parser.parse_args()
+        else:
+            positionals.append(arg)
 
-    identifier = getattr(args, "username-or-email")
-    password = args.password
-    url = args.url
+    if len(positionals) != 2:  # noqa: PLR2004
+        sys.exit(f"{_USAGE}\nvelum: error: expected a username-or-email and a password")
+
+    identifier, password = positionals
+    return identifier, password, url
+
+
+def main() -> None:
+    identifier, password, url = _parse_args(sys.argv[1:])
 
     token = asyncio.run(create_password(identifier, password, url))
     print(token)
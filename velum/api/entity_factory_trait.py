@@ -6,7 +6,6 @@ from velum.internal import data_binding
 __all__: typing.Sequence[str] = ("EntityFactory",)
 
 
-@typing.runtime_checkable
 class EntityFactory(typing.Protocol):
     __slots__: typing.Sequence[str] = ()
 
@@ -9,7 +9,6 @@ from velum.internal import data_binding
 __all__: typing.Sequence[str] = ("EventFactory",)
 
 
-@typing.runtime_checkable
 class EventFactory(typing.Protocol):
     __slots__: typing.Sequence[str] = ()
 
@@ -11,7 +11,6 @@ __all__: typing.Sequence[str] = ("EventManager",)
 EventPredicateT = typing.Callable[[base_events.EventT], bool]
 
 
-@typing.runtime_checkable
 class EventManager(typing.Protocol):
     __slots__: typing.Sequence[str] = ()
 
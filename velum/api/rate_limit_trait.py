@@ -5,7 +5,6 @@ import typing_extensions
 __all__: typing.Sequence[str] = ("RateLimiter",)
 
 
-@typing.runtime_checkable
 class RateLimiter(typing.Protocol):
     __slots__: typing.Sequence[str] = ()
 
@@ -10,7 +10,6 @@ from velum.api import entity_factory_trait
 __all__: typing.Sequence[str] = ("RESTClient",)
 
 
-@typing.runtime_checkable
 class RESTClient(typing.Protocol):
     __slots__: typing.Sequence[str] = ()
 
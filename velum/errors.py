@@ -1,7 +1,5 @@
 import typing
 
-import attr
-
 __all__: typing.Sequence[str] = (
     "VelumError",
     "GatewayError",
@@ -11,33 +9,52 @@ __all__: typing.Sequence[str] = (
 )
 
 
-@attr.define(auto_exc=True, repr=False, init=False, slots=False)
 class VelumError(RuntimeError):
     "idk lol"
 
+    __slots__: typing.Sequence[str] = ()
+
 
-@attr.define(auto_exc=True, repr=False, slots=False)
 class GatewayError(VelumError):
-    reason: str = attr.field()
+    __slots__: typing.Sequence[str] = ("reason",)
+
+    reason: str
+
+    def __init__(self, reason: str) -> None:
+        super().__init__(reason)
+        self.reason = reason
 
     def __str__(self) -> str:
         return self.reason
 
 
-@attr.define(auto_exc=True, repr=False, slots=False)
 class GatewayConnectionError(GatewayError):
+    __slots__: typing.Sequence[str] = ()
+
     def __str__(self) -> str:
         return f"Failed to connect to server: {self.reason}"
 
 
-@attr.define(auto_exc=True, repr=False, slots=False)
 class GatewayConnectionClosedError(GatewayError):
-    code: int | None = attr.field()
+    __slots__: typing.Sequence[str] = ("code", "_str")
+
+    code: int | None
+
+    def __init__(self, reason: str, code: int | None) -> None:
+        super().__init__(reason)
+        self.args = (reason, code)
+        self.code = code
+        self._str = f"Server closed connection with code {code} ({reason})"
 
     def __str__(self) -> str:
-        return f"Server closed connection with code {self.code} ({self.reason})"
+        return self._str
 
 
-@attr.define(auto_exc=True, repr=False, slots=False)
 class HTTPError(VelumError):
-    message: str = attr.field()
+    __slots__: typing.Sequence[str] = ("message",)
+
+    message: str
+
+    def __init__(self, message: str) -> None:
+        super().__init__(message)
+        self.message = message
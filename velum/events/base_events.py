@@ -12,9 +12,6 @@ EventT = typing.TypeVar("EventT", bound="Event")
 EventCallbackT = typing.Callable[[EventT], typing.Coroutine[typing.Any, typing.Any, None]]
 
 
-_id_counter = 1
-
-
 class Event(abc.ABC):
     """Base type for all events"""
 
@@ -22,6 +19,7 @@ class Event(abc.ABC):
 
     bitmask: typing.ClassVar[int]
     dispatches: typing.ClassVar[typing.Sequence[type[Event]]]
+    _id_counter: typing.ClassVar[int] = 1
 
     def __init_subclass__(cls) -> None:
         super().__init_subclass__()
@@ -34,17 +32,21 @@ class Event(abc.ABC):
         #    2. As not all event classes are decorated with attrs.define, we
         #       must also set it in the original run, as otherwise cls.dispatches
         #       would not be set at all.
-        cls.dispatches = tuple(sub_cls for sub_cls in cls.mro() if issubclass(sub_cls, Event))
+        event_bases = [base for base in cls.__bases__ if issubclass(base, Event)]
+        if len(event_bases) == 1:
+            # With a single event base, its dispatches already hold the rest
+            # of the event MRO, so there is no need to walk it again.
+            cls.dispatches = (cls, *event_bases[0].dispatches)
+        else:
+            cls.dispatches = tuple(sub_cls for sub_cls in cls.mro() if issubclass(sub_cls, Event))
 
         if "__attrs_attrs__" in cls.__dict__:
             # attrs runs __new__ a second time on class creation, and we don't
             # need to increment the bitmask again.
             return
 
-        global _id_counter  # noqa: PLW0603
-
-        cls.bitmask = 1 << _id_counter
-        _id_counter += 1
+        cls.bitmask = 1 << Event._id_counter
+        Event._id_counter += 1
 
 
 # Set event parameters on the actual event class.
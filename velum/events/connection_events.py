@@ -26,7 +26,7 @@ class DisconnectEvent(base_events.Event):
     __slots__: typing.Sequence[str] = ()
 
 
-@attr.define(kw_only=True, weakref_slot=False)
+@attr.define(weakref_slot=False)
 class HelloEvent(base_events.Event):
     """Event fired when the gateway first connects."""
 
@@ -53,7 +53,7 @@ class HelloEvent(base_events.Event):
         return self.data.pandemonium_info
 
 
-@attr.define(kw_only=True, weakref_slot=False)
+@attr.define(weakref_slot=False)
 class RatelimitEvent(base_events.Event):
     """Event fired when the gateway ratelimits the client."""
 
@@ -66,7 +66,7 @@ class RatelimitEvent(base_events.Event):
         return self.data.wait
 
 
-@attr.define(kw_only=True, weakref_slot=False)
+@attr.define(weakref_slot=False)
 class AuthenticatedEvent(base_events.Event):
     """Event fired when the client is authenticated."""
 
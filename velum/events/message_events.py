@@ -14,7 +14,7 @@ class MessageEvent(base_events.Event):
     __slots__ = ()
 
 
-@attr.define(kw_only=True, weakref_slot=False)
+@attr.define(weakref_slot=False)
 class MessageCreateEvent(MessageEvent):
     """An event that is fired when a message is created."""
 
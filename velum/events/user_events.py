@@ -21,14 +21,14 @@ class UserEvent(base_events.Event):
     __slots__ = ()
 
 
-@attr.define(kw_only=True, weakref_slot=False)
+@attr.define(weakref_slot=False)
 class UserUpdateEvent(UserEvent):
     """Event fired when a user's information is updated."""
 
     user: models.User = attr.field()
 
 
-@attr.define(kw_only=True, weakref_slot=False)
+@attr.define(weakref_slot=False)
 class PresenceUpdateEvent(UserEvent):
     """Event fired when a user's presence is updated."""
 
@@ -6,7 +6,7 @@ from __future__ import annotations
 import abc
 import asyncio
 import concurrent.futures
-import contextlib
+import functools
 import inspect
 import io
 import mimetypes
@@ -25,6 +25,28 @@ from velum.internal import async_utils
 if typing.TYPE_CHECKING:
     import types
 
+__all__: typing.Sequence[str] = (
+    "ReaderT",
+    "ReaderT_co",
+    "PathLike",
+    "RawData",
+    "ResourceLike",
+    "LazyByteIterator",
+    "ensure_path",
+    "unwrap_bytes",
+    "read_many",
+    "ensure_resource",
+    "AsyncReader",
+    "AsyncReaderContextManager",
+    "Resource",
+    "ThreadedFileReader",
+    "File",
+    "WebReader",
+    "URL",
+    "IteratorReader",
+    "Bytes",
+)
+
 ReaderT = typing.TypeVar("ReaderT", bound="AsyncReader")
 ReaderT_co = typing_extensions.TypeVar(
     "ReaderT_co",
@@ -54,7 +76,60 @@ LazyByteIterator = (
     | aiohttp.StreamReader
 )
 
-_BUFFER_SIZE: typing.Final[int] = 50 << 10
+_DEFAULT_BUFFER_SIZE: typing.Final[int] = 256 << 10
+
+
+def _get_buffer_size() -> int:
+    value = os.environ.get("VELUM_IO_BUFFER")
+    if not value:
+        return _DEFAULT_BUFFER_SIZE
+
+    try:
+        buffer_size = int(value)
+    except ValueError:
+        buffer_size = None
+
+    # Chunked reads stop once a chunk comes back short, so a non-positive size
+    # would never terminate.
+    if buffer_size is None or buffer_size <= 0:
+        msg = f"VELUM_IO_BUFFER must be a positive integer (in bytes), got {value!r}."
+        raise ValueError(msg)
+
+    return buffer_size
+
+
+# Larger chunks mean fewer executor round-trips and syscalls per resource, at
+# the cost of more memory per chunk in flight. Defaults to 256 KiB, and can be
+# tuned through the `VELUM_IO_BUFFER` environment variable (in bytes).
+_BUFFER_SIZE: typing.Final[int] = _get_buffer_size()
+
+_DEFAULT_MIMETYPE: typing.Final[str] = "text/plain;charset=UTF-8"
+
+_URL_SCHEMES: typing.Final[tuple[str, ...]] = ("http://", "https://")
+
+
+@functools.lru_cache(maxsize=1024)
+def _guess_mimetype_from_suffix(suffix: str) -> str | None:
+    mimetype, _ = mimetypes.guess_type(f"file{suffix}")
+    return mimetype
+
+
+def _guess_mimetype(filename: str) -> str | None:
+    # The guess only depends on the last suffix, so lookups are cached by that
+    # rather than by the (often unique) filename.
+    stem, _, suffix = filename.rpartition(".")
+    # Names without a suffix, and dotfiles such as ".png", have no type.
+    if not stem.lstrip("."):
+        return None
+
+    suffix = f".{suffix.lower()}"
+    if suffix in mimetypes.encodings_map:
+        # Compressed files (such as .tar.gz) are typed by the suffix before.
+        stem, _, inner = stem.rpartition(".")
+        if stem.lstrip("."):
+            suffix = f".{inner.lower()}{suffix}"
+
+    return _guess_mimetype_from_suffix(suffix)
 
 
 def ensure_path(pathish: PathLike) -> pathlib.Path:
@@ -62,19 +137,56 @@ def ensure_path(pathish: PathLike) -> pathlib.Path:
     return pathlib.Path(pathish)
 
 
+@functools.singledispatch
 def unwrap_bytes(data: RawData) -> bytes:
-    """Convert a byte-like object to bytes."""
+    """Convert a byte-like object to bytes.
+
+    Buffered IO objects are converted using their entire contents,
+    regardless of their current stream position.
+    """
+    return typing.cast(bytes, data)
+
+
+@unwrap_bytes.register
+def _(data: bytearray) -> bytes:
+    return bytes(data)
 
-    if isinstance(data, bytearray):
-        data = bytes(data)
-    elif isinstance(data, memoryview):
-        data = data.tobytes()
-    elif isinstance(data, io.StringIO):
-        data = bytes(data.read(), "utf-8")
-    elif isinstance(data, io.BytesIO):
-        data = data.read()
 
-    return data
+@unwrap_bytes.register
+def _(data: memoryview) -> bytes:
+    return data.tobytes()
+
+
+@unwrap_bytes.register
+def _(data: io.BytesIO) -> bytes:
+    return data.getvalue()
+
+
+@unwrap_bytes.register
+def _(data: io.StringIO) -> bytes:
+    return data.getvalue().encode("utf-8")
+
+
+async def read_many(
+    resources: typing.Iterable[Resource[AsyncReader]],
+    /,
+    *,
+    concurrency: int = 8,
+    executor: concurrent.futures.Executor | None = None,
+) -> list[bytes]:
+    """Read multiple resources concurrently.
+
+    At most `concurrency` resources are read at once, which bounds how many
+    are held in memory while still in progress. The results are returned
+    in the same order as the provided resources.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def read_one(resource: Resource[AsyncReader]) -> bytes:
+        async with semaphore:
+            return await resource.read(executor=executor)
+
+    return await asyncio.gather(*(read_one(resource) for resource in resources))
 
 
 def ensure_resource(
@@ -93,19 +205,26 @@ def ensure_resource(
         return Bytes(data, filename)
 
     # Probably a URL or filepath at this point.
-    data = str(data)
+    if not isinstance(data, str):
+        data = os.fspath(data)
 
-    if data.startswith(("http://", "https://")):
+    # Schemes are case-insensitive, and only the first few characters of what
+    # may be a long string need to be lowered to check them.
+    if data[:8].lower().startswith(_URL_SCHEMES):
         return URL(data)
 
     return File(data)
 
 
 @attr.define(weakref_slot=False)
-class AsyncReader(typing.AsyncIterable[bytes], abc.ABC):
+class AsyncReader(typing.AsyncIterable[bytes | bytearray | memoryview], abc.ABC):
     """Protocol for reading a resource asynchronously using bit inception.
     This supports being used as an async iterable, although the implementation
     detail is left to each implementation of this class to define.
+
+    Iterating a reader may yield any bytes-like object rather than strictly
+    `bytes`, so as to avoid copying data. Use `read` to get the resource as
+    a single `bytes` object.
     """
 
     filename: str = attr.field(repr=True)
@@ -116,10 +235,8 @@ class AsyncReader(typing.AsyncIterable[bytes], abc.ABC):
 
     async def read(self) -> bytes:
         """Read the rest of the resource and return it in a `bytes` object."""
-        buff = bytearray()
-        async for chunk in self:
-            buff.extend(chunk)
-        return buff
+        # Joining the chunks once avoids repeatedly growing a single buffer.
+        return b"".join([chunk async for chunk in self])
 
 
 class AsyncReaderContextManager(abc.ABC, typing.Generic[ReaderT]):
@@ -148,7 +265,11 @@ class Resource(typing.Generic[ReaderT_co], abc.ABC):
     resources.
     """
 
-    __slots__: typing.Sequence[str] = ()
+    # Lazily computed from the filename, which never changes after init.
+    __slots__: typing.Sequence[str] = ("_extension", "_hash")
+
+    _extension: str | None
+    _hash: int
 
     @property
     @abc.abstractmethod
@@ -158,8 +279,12 @@ class Resource(typing.Generic[ReaderT_co], abc.ABC):
     @property
     def extension(self) -> str | None:
         """File extension, if there is one."""
-        _, _, ext = self.filename.rpartition(".")
-        return ext if ext != self.filename else None
+        try:
+            return self._extension
+        except AttributeError:
+            _, _, ext = self.filename.rpartition(".")
+            self._extension = ext if ext != self.filename else None
+            return self._extension
 
     async def read(
         self,
@@ -190,7 +315,11 @@ class Resource(typing.Generic[ReaderT_co], abc.ABC):
         return False
 
     def __hash__(self) -> int:
-        return hash((self.__class__, self.filename))
+        try:
+            return self._hash
+        except AttributeError:
+            self._hash = hash((self.__class__, self.filename))
+            return self._hash
 
 
 # Local files
@@ -207,18 +336,46 @@ class ThreadedFileReader(AsyncReader):
     _executor: concurrent.futures.ThreadPoolExecutor | None = attr.field()
     _pointer: typing.BinaryIO = attr.field()
 
+    buffer_size: int = attr.field(default=_BUFFER_SIZE, kw_only=True, repr=False)
+    """The maximum size of each chunk read from the file."""
+
+    async def read(self) -> bytes:
+        # An unbounded read sizes its buffer from the file's stat, so the rest
+        # of the file is read in one executor call without any regrowing.
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._pointer.read)
+
     async def __aiter__(self) -> typing.AsyncGenerator[typing.Any, bytes]:
         loop = asyncio.get_running_loop()
+        buffer_size = self.buffer_size
 
         while True:
-            chunk = await loop.run_in_executor(self._executor, self._pointer.read, _BUFFER_SIZE)
+            chunk = await loop.run_in_executor(self._executor, self._pointer.read, buffer_size)
             yield chunk
-            if len(chunk) < _BUFFER_SIZE:
+            if len(chunk) < buffer_size:
                 break
 
 
+# O_BINARY only exists (and matters) on Windows.
+_OPEN_FLAGS: typing.Final[int] = os.O_RDONLY | getattr(os, "O_BINARY", 0)
+
+
 def _open_path(path: pathlib.Path) -> typing.BinaryIO:
-    return path.expanduser().open("rb")
+    fd = os.open(os.path.expanduser(path), _OPEN_FLAGS)
+
+    try:
+        if hasattr(os, "posix_fadvise"):
+            # Hint that the file will be read front to back, so the kernel
+            # can read ahead more aggressively. Not every platform has this.
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+
+        # Match the buffer to the chunk size rather than the (much smaller)
+        # block size that io.open would default to.
+        return os.fdopen(fd, "rb", buffering=_BUFFER_SIZE)
+
+    except BaseException:
+        os.close(fd)
+        raise
 
 
 @attr.define(weakref_slot=False)
@@ -321,7 +478,9 @@ class WebReader(AsyncReader):
     """Optional character set information, if known."""
 
     size: int | None = attr.field()
-    """The size of the resource, if known."""
+    """The size of the resource, if known.
+    This is `None` if the content is encoded, as it is decoded while read.
+    """
 
     head_only: bool = attr.field()
     """If `True`, then only the HEAD was requested.
@@ -335,10 +494,12 @@ class WebReader(AsyncReader):
     async def __aiter__(self) -> typing.AsyncGenerator[typing.Any, bytes]:
         if self.head_only:
             yield b""
-        else:
-            while not self.stream.at_eof():
-                chunk, _ = await self.stream.readchunk()
-                yield chunk
+            return
+
+        # Batch the received data into chunks of up to the buffer size, instead
+        # of yielding every (often tiny) chunk as it arrives off the socket.
+        async for chunk in self.stream.iter_chunked(_BUFFER_SIZE):
+            yield chunk
 
 
 @attr.define(weakref_slot=False)
@@ -346,19 +507,31 @@ class WebReader(AsyncReader):
 class _WebReader(AsyncReaderContextManager[WebReader]):
     _web_resource: URL = attr.field()
     _head_only: bool = attr.field()
-    _exit_stack: contextlib.AsyncExitStack | None = None
+    _session: aiohttp.ClientSession | None = attr.field(default=None)
+    _response: aiohttp.ClientResponse | None = attr.field(default=None, init=False)
+    _owned_session: aiohttp.ClientSession | None = attr.field(default=None, init=False)
 
     async def __aenter__(self) -> WebReader:
-        stack = contextlib.AsyncExitStack()
+        # Reuse the pooled connections of the provided session where possible,
+        # and only fall back to a session of our own for this one read.
+        if self._session is not None and not self._session.closed:
+            client_session = self._session
+        else:
+            client_session = self._owned_session = aiohttp.ClientSession()
 
-        client_session = await stack.enter_async_context(aiohttp.ClientSession())
         method = "HEAD" if self._head_only else "GET"
 
         try:
-            resp = await stack.enter_async_context(
-                client_session.request(method, self._web_resource.url, raise_for_status=False),
+            resp = await client_session.request(
+                method,
+                self._web_resource.url,
+                raise_for_status=False,
             )
+        except BaseException:
+            await self._close_owned_session()
+            raise
 
+        try:
             if 200 <= resp.status < 400:  # noqa: PLR2004
                 mimetype = None
                 filename = self._web_resource.filename
@@ -369,7 +542,13 @@ class _WebReader(AsyncReaderContextManager[WebReader]):
                 if mimetype is None:
                     mimetype = resp.content_type
 
-                self._exit_stack = stack
+                # aiohttp transparently decompresses encoded content, in which
+                # case the length header is the compressed size, not ours.
+                size = (
+                    None if aiohttp.hdrs.CONTENT_ENCODING in resp.headers else resp.content_length
+                )
+
+                self._response = resp
 
                 return WebReader(
                     stream=resp.content,
@@ -379,7 +558,7 @@ class _WebReader(AsyncReaderContextManager[WebReader]):
                     filename=filename,
                     charset=resp.charset,
                     mimetype=mimetype,
-                    size=resp.content_length,
+                    size=size,
                     head_only=self._head_only,
                 )
 
@@ -387,7 +566,8 @@ class _WebReader(AsyncReaderContextManager[WebReader]):
             raise RuntimeError(msg)  # noqa: TRY301
 
         except Exception:
-            await stack.aclose()
+            resp.release()
+            await self._close_owned_session()
             raise
 
     async def __aexit__(
@@ -396,18 +576,33 @@ class _WebReader(AsyncReaderContextManager[WebReader]):
         exc: BaseException | None,
         exc_tb: types.TracebackType | None,
     ) -> None:
-        if self._exit_stack:
-            await self._exit_stack.aclose()
+        if self._response is not None:
+            self._response.release()
+            self._response = None
+
+        await self._close_owned_session()
+
+    async def _close_owned_session(self) -> None:
+        if self._owned_session is not None:
+            await self._owned_session.close()
+            self._owned_session = None
 
 
 @typing.final
 class URL(Resource[WebReader]):
-    """A URL that represents a web resource."""
+    """A URL that represents a web resource.
 
-    __slots__: typing.Sequence[str] = ("_url",)
+    If a `session` is provided, it is used to stream the resource for as long
+    as it is open. Otherwise, every stream uses a session of its own.
+    """
 
-    def __init__(self, url: str) -> None:
+    __slots__: typing.Sequence[str] = ("_url", "_filename", "_session")
+
+    def __init__(self, url: str, *, session: aiohttp.ClientSession | None = None) -> None:
         self._url = url
+        # The URL is immutable, so it only needs to be parsed once.
+        self._filename = pathlib.Path(urllib.parse.urlparse(url).path).name
+        self._session = session
 
     @property
     def url(self) -> str:
@@ -415,16 +610,21 @@ class URL(Resource[WebReader]):
 
     @property
     def filename(self) -> str:
-        url = urllib.parse.urlparse(self._url)
-        return pathlib.Path(url.path).name
+        return self._filename
 
     def stream(
         self,
         *,
         executor: concurrent.futures.Executor | None = None,  # noqa: ARG002
         head_only: bool = False,
+        session: aiohttp.ClientSession | None = None,
     ) -> AsyncReaderContextManager[WebReader]:
-        return _WebReader(self, head_only)
+        """Start streaming the content in chunks.
+
+        The provided `session` takes precedence over the one the URL was
+        created with, if any.
+        """
+        return _WebReader(self, head_only, session if session is not None else self._session)
 
 
 # In-memory data and streams.
@@ -432,66 +632,109 @@ class URL(Resource[WebReader]):
 
 @attr.define(weakref_slot=False)
 class IteratorReader(AsyncReader):
-    """Asynchronous file reader that operates on in-memory data."""
+    """Asynchronous file reader that operates on in-memory data.
+
+    If the data is already `bytes`, chunks are yielded as read-only
+    `memoryview` slices of it instead of copies. Otherwise, each chunk is
+    yielded as a new `bytearray` that the reader never touches again, so it
+    may safely be kept or modified by the consumer.
+    """
 
     data: bytes | LazyByteIterator = attr.field()
     """The data that will be yielded in chunks."""
 
-    async def __aiter__(self) -> typing.AsyncGenerator[typing.Any, bytes]:
+    buffer_size: int = attr.field(default=_BUFFER_SIZE, kw_only=True, repr=False)
+    """The maximum size of each chunk yielded from in-memory bytes, and the
+    size to which lazily provided chunks are buffered before being yielded.
+    """
+
+    async def read(self) -> bytes:
+        if isinstance(self.data, bytes):
+            return self.data
+
+        return await super().read()
+
+    async def __aiter__(self) -> typing.AsyncGenerator[bytes | bytearray | memoryview, typing.Any]:
+        buffer_size = self.buffer_size
+
+        if isinstance(self.data, bytes):
+            # The data is already fully in memory, so chunks are yielded as
+            # zero-copy views into it rather than as sliced copies.
+            view = memoryview(self.data)
+            for i in range(0, len(view), buffer_size):
+                yield view[i : i + buffer_size]
+
+            return
+
         buff = bytearray()
         iterator = self._wrap_iter()
 
         while True:
             try:
-                while len(buff) < _BUFFER_SIZE:
+                while len(buff) < buffer_size:
                     chunk = await anext(iterator)
                     buff.extend(chunk)
-                yield bytes(buff)
-                buff.clear()
+                # Hand the filled buffer over to the consumer as-is and start
+                # a new one, rather than copying it into a `bytes` object. The
+                # yielded buffer must never be reused, as it may be kept.
+                yield buff
+                buff = bytearray()
             except StopAsyncIteration:  # noqa: PERF203
                 break
 
         if buff:
-            yield bytes(buff)
+            yield buff
 
-    # TODO: Refactor this
-    async def _wrap_iter(self) -> typing.AsyncGenerator[typing.Any, bytes]:  # noqa: C901, PLR0912
-        if isinstance(self.data, bytes):
-            for i in range(0, len(self.data), _BUFFER_SIZE):
-                yield self.data[i : i + _BUFFER_SIZE]
+    def _wrap_iter(self) -> typing.AsyncIterator[bytes]:
+        # The kind of data is only classified once per stream, after which
+        # chunks are pulled through a loop specialised for that kind.
+        data = self.data
 
-        elif async_utils.is_async_iterator(self.data) or inspect.isasyncgen(self.data):
-            try:
-                while True:
-                    yield self._assert_bytes(await self.data.__anext__())
-            except StopAsyncIteration:
-                pass
+        if async_utils.is_async_iterator(data) or inspect.isasyncgen(data):
+            return self._wrap_async_iterator(data)
 
-        elif isinstance(self.data, typing.Iterator):
-            try:
-                while True:
-                    yield self._assert_bytes(next(self.data))  # pyright: ignore
-            except StopIteration:
-                pass
+        # Generators are iterators, and iterators are iterables; both are
+        # consumed the same way.
+        if isinstance(data, typing.Iterator):
+            return self._wrap_iterable(data)
 
-        elif inspect.isgenerator(self.data):
-            try:
-                while True:
-                    yield self._assert_bytes(self.data.send(None))
-            except StopIteration:
-                pass
+        if async_utils.is_async_iterable(data):
+            return self._wrap_async_iterable(data)
 
-        elif async_utils.is_async_iterable(self.data):
-            async for chunk in self.data:
-                yield self._assert_bytes(chunk)
+        if isinstance(data, typing.Iterable):
+            return self._wrap_iterable(data)
 
-        elif isinstance(self.data, typing.Iterable):
-            for chunk in self.data:
-                yield self._assert_bytes(chunk)
+        msg = f"Expected bytes but received {type(data).__name__}"
+        raise TypeError(msg)
 
-        else:
-            # Will always fail.
-            self._assert_bytes(self.data)
+    @classmethod
+    async def _wrap_async_iterator(
+        cls,
+        data: typing.AsyncIterator[typing.Any],
+    ) -> typing.AsyncGenerator[bytes, typing.Any]:
+        next_chunk = data.__anext__
+        while True:
+            try:
+                chunk = await next_chunk()
+            except StopAsyncIteration:
+                return
+            yield cls._assert_bytes(chunk)
+
+    @classmethod
+    async def _wrap_async_iterable(
+        cls,
+        data: typing.AsyncIterable[typing.Any],
+    ) -> typing.AsyncGenerator[bytes, typing.Any]:
+        async for chunk in data:
+            yield cls._assert_bytes(chunk)
+
+    @classmethod
+    async def _wrap_iterable(
+        cls,
+        data: typing.Iterable[typing.Any],
+    ) -> typing.AsyncGenerator[bytes, typing.Any]:
+        for chunk in data:
+            yield cls._assert_bytes(chunk)
 
     @staticmethod
     def _assert_bytes(data: object) -> bytes:
@@ -549,10 +792,10 @@ class Bytes(Resource[IteratorReader]):
         self.data = data
 
         if mimetype is None:
-            mimetype, _ = mimetypes.guess_type(filename)
+            mimetype = _guess_mimetype(filename)
 
         if mimetype is None:
-            mimetype = "text/plain;charset=UTF-8"
+            mimetype = _DEFAULT_MIMETYPE
 
         self._filename = filename
         self.mimetype = mimetype
@@ -6,11 +6,6 @@ import time
 import typing
 
 from velum import traits
-from velum.impl import entity_factory
-from velum.impl import event_factory
-from velum.impl import event_manager
-from velum.impl import gateway
-from velum.impl import rest
 
 if typing.TYPE_CHECKING:
     from velum.api import entity_factory_trait
@@ -37,7 +32,9 @@ class GatewayClient(traits.GatewayClientAware):
         "_event_manager",
         "_rest",
         "_gateway",
-        "_closing_event",
+        "_closing_future",
+        "_dispatch",
+        "_wait_for",
     )
 
     _entity_factory: entity_factory_trait.EntityFactory
@@ -45,7 +42,9 @@ class GatewayClient(traits.GatewayClientAware):
     _event_manager: event_manager_trait.EventManager
     _rest: rest_trait.RESTClient
     _gateway: gateway_trait.GatewayHandler
-    _closing_event: asyncio.Event | None
+    _closing_future: asyncio.Future[None] | None
+    _dispatch: typing.Callable[[base_events.Event], asyncio.Future[typing.Any]]
+    _wait_for: typing.Callable[..., typing.Coroutine[typing.Any, typing.Any, typing.Any]]
 
     def __init__(
         self,
@@ -60,96 +59,119 @@ class GatewayClient(traits.GatewayClientAware):
         *,
         token: str,
     ) -> None:
-        self._entity_factory = (
-            entity_factory_impl
-            if entity_factory_impl is not None
-            else entity_factory.EntityFactory()
-        )
-        self._event_factory = (
-            event_factory_impl
-            if event_factory_impl is not None
-            else event_factory.EventFactory(self._entity_factory)
-        )
-        self._event_manager = (
-            event_manager_impl
-            if event_manager_impl is not None
-            else event_manager.EventManager(self._event_factory)
-        )
+        # The default implementations are only imported when they are actually
+        # used, so that providing custom ones does not pay for importing them.
+        if entity_factory_impl is None:
+            from velum.impl import entity_factory
+
+            entity_factory_impl = entity_factory.EntityFactory()
+
+        self._entity_factory = entity_factory_impl
+
+        if event_factory_impl is None:
+            from velum.impl import event_factory
+
+            event_factory_impl = event_factory.EventFactory(self._entity_factory)
+
+        self._event_factory = event_factory_impl
+
+        if event_manager_impl is None:
+            from velum.impl import event_manager
+
+            event_manager_impl = event_manager.EventManager(self._event_factory)
+
+        self._event_manager = event_manager_impl
+
+        # Bind the event manager methods that may be called repeatedly at
+        # runtime, so that they are not looked up through it on every call.
+        self._dispatch = self._event_manager.dispatch
+        self._wait_for = self._event_manager.wait_for
 
         # RESTful API.
-        self._rest = (
-            rest_client_impl
-            if rest_client_impl is not None
-            else rest.RESTClient(
+        if rest_client_impl is None:
+            from velum.impl import rest
+
+            rest_client_impl = rest.RESTClient(
                 rest_url=rest_url,
                 cdn_url=cdn_url,
                 token=token,
                 entity_factory=self._entity_factory,
             )
-        )
+
+        self._rest = rest_client_impl
 
         # Gateway connection.
-        self._gateway = (
-            gateway_impl
-            if gateway_impl is not None
-            else gateway.GatewayHandler(
+        if gateway_impl is None:
+            from velum.impl import gateway
+
+            gateway_impl = gateway.GatewayHandler(
                 gateway_url=gateway_url,
                 event_manager=self._event_manager,
                 token=token,
             )
-        )
+
+        self._gateway = gateway_impl
 
         # Setup state.
-        self._closing_event: asyncio.Event | None = None
+        self._closing_future: asyncio.Future[None] | None = None
 
     async def start(self) -> None:
-        if self._closing_event:
+        if self._closing_future:
             msg = "Cannot start an already running client."
             raise RuntimeError(msg)
 
-        start_time = time.monotonic()
-        self._closing_event = asyncio.Event()
+        # Only time the startup if it is actually going to be logged.
+        log_startup = _LOGGER.isEnabledFor(logging.INFO)
+        start_time = time.perf_counter_ns() if log_startup else 0
+
+        # A bare future is enough to wait for closing, as there is only ever
+        # a single waiter.
+        self._closing_future = asyncio.get_running_loop().create_future()
 
         self._rest.start()
         await self._gateway.start()
 
-        _LOGGER.info(
-            "Started succesfully in approximately %.2f [s].",
-            time.monotonic() - start_time,
-        )
+        if log_startup:
+            _LOGGER.info(
+                "Started succesfully in approximately %.2f [s].",
+                (time.perf_counter_ns() - start_time) / 1_000_000_000,
+            )
 
-        await self._closing_event.wait()
+        await self._closing_future
 
     async def close(self) -> None:
-        if not self._closing_event:
+        if not self._closing_future:
             msg = "Cannot close an inactive client."
             raise RuntimeError(msg)
 
-        if self._closing_event.is_set():
+        if self._closing_future.done() and not self._closing_future.cancelled():
             return
 
-        self._closing_event.set()
-
-        loop = asyncio.get_running_loop()
+        if not self._closing_future.done():
+            self._closing_future.set_result(None)
 
-        async def handle(name: str, awaitable: typing.Awaitable[typing.Any]) -> None:
-            future = asyncio.ensure_future(awaitable)
+        # Shut the gateway and REST client down concurrently, as they are
+        # entirely independent of each other.
+        results = await asyncio.gather(
+            self._gateway.close(),
+            self._rest.close(),
+            return_exceptions=True,
+        )
 
-            try:
-                await future
-            except Exception as ex:  # noqa: BLE001
+        loop = asyncio.get_running_loop()
+        for name, result in zip(("gateway", "rest"), results, strict=True):
+            if isinstance(result, Exception):
                 loop.call_exception_handler(
                     {
                         "message": f"{name} raised an exception during shut down",
-                        "future": future,
-                        "exception": ex,
+                        "exception": result,
                     },
                 )
 
-        await handle("gateway", self._gateway.close())
-        await handle("rest", self._rest.close())
+            elif isinstance(result, BaseException):
+                raise result
 
-        self._closing_event = None
+        self._closing_future = None
 
         _LOGGER.info("Client closed successfully.")
 
@@ -175,10 +197,10 @@ class GatewayClient(traits.GatewayClientAware):
 
     @property
     def is_alive(self) -> bool:
-        return self._closing_event is not None
+        return self._closing_future is not None
 
     def dispatch(self, event: base_events.Event) -> asyncio.Future[typing.Any]:
-        return self._event_manager.dispatch(event)
+        return self._dispatch(event)
 
     def get_listeners(
         self,
@@ -219,4 +241,4 @@ class GatewayClient(traits.GatewayClientAware):
         timeout: float | None,
         predicate: event_manager_trait.EventPredicateT[base_events.EventT] | None = None,
     ) -> base_events.EventT:
-        return await self._event_manager.wait_for(event_type, timeout=timeout, predicate=predicate)
+        return await self._wait_for(event_type, timeout=timeout, predicate=predicate)
@@ -1,4 +1,4 @@
-import ipaddress
+import operator
 import typing
 
 from velum import models
@@ -8,6 +8,28 @@ from velum.internal import data_binding
 __all__: typing.Sequence[str] = ("EntityFactory",)
 
 
+# The required fields of the larger payloads are fetched in a single call.
+_INSTANCE_INFO_FIELDS: typing.Final = operator.itemgetter(
+    "instance_name",
+    "version",
+    "description",
+    "message_limit",
+    "oprish_url",
+    "pandemonium_url",
+    "effis_url",
+    "file_size",
+    "attachment_file_size",
+)
+_USER_FIELDS: typing.Final = operator.itemgetter(
+    "id",
+    "username",
+    "social_credit",
+    "status",
+    "badges",
+    "permissions",
+)
+
+
 class EntityFactory(entity_factory_trait.EntityFactory):
     __slots__ = ()
 
@@ -18,20 +40,19 @@ class EntityFactory(entity_factory_trait.EntityFactory):
         return models.Message(content=content, author=author)
 
     def deserialize_instance_info(self, payload: data_binding.JSONObject) -> models.InstanceInfo:
-        instance_name = typing.cast(str, payload["instance_name"])
-        version = typing.cast(str, payload["version"])
-        description = typing.cast(str | None, payload["description"])
-        message_limit = typing.cast(int, payload["message_limit"])
-        oprish_url = typing.cast(str, payload["oprish_url"])
-        pandemonium_url = typing.cast(str, payload["pandemonium_url"])
-        effis_url = typing.cast(str, payload["effis_url"])
-        file_size = typing.cast(int, payload["file_size"])
-        attachment_file_size = typing.cast(int, payload["attachment_file_size"])
-
-        rate_limits = typing.cast(
-            data_binding.JSONObject | None,
-            payload.get("rate_limits"),
-        )
+        (
+            instance_name,
+            version,
+            description,
+            message_limit,
+            oprish_url,
+            pandemonium_url,
+            effis_url,
+            file_size,
+            attachment_file_size,
+        ) = _INSTANCE_INFO_FIELDS(payload)
+
+        rate_limits = typing.cast(data_binding.JSONObject | None, payload.get("rate_limits"))
         if rate_limits is not None:
             rate_limits = self.deserialize_ratelimits(rate_limits)
 
@@ -39,12 +60,12 @@ class EntityFactory(entity_factory_trait.EntityFactory):
             instance_name=instance_name,
             description=description,
             version=version,
-            message_limit=int(message_limit),
+            message_limit=message_limit,
             oprish_url=oprish_url,
             pandemonium_url=pandemonium_url,
             effis_url=effis_url,
-            file_size=int(file_size),
-            attachment_file_size=int(attachment_file_size),
+            file_size=file_size,
+            attachment_file_size=attachment_file_size,
             rate_limits=rate_limits,
         )
 
@@ -144,7 +165,7 @@ class EntityFactory(entity_factory_trait.EntityFactory):
             id=id_,
             name=name,
             bucket=bucket,
-            spoiler=bool(spoiler),
+            spoiler=spoiler is True,
             metadata=metadata,
         )
 
@@ -200,7 +221,7 @@ class EntityFactory(entity_factory_trait.EntityFactory):
             user_id=user_id,
             platform=platform,
             client=client,
-            ip=ipaddress.ip_address(ip),
+            ip=ip,
         )
 
     def _deserialize_status(self, payload: data_binding.JSONObject) -> models.Status:
@@ -210,16 +231,11 @@ class EntityFactory(entity_factory_trait.EntityFactory):
         return models.Status(type=models.StatusType(type_), text=text)
 
     def deserialize_user(self, payload: data_binding.JSONObject) -> models.User:
-        id_ = typing.cast(int, payload["id"])
-        username = typing.cast(str, payload["username"])
+        id_, username, social_credit, status, badges, permissions = _USER_FIELDS(payload)
         display_name = typing.cast(str | None, payload.get("display_name"))
-        social_credit = typing.cast(int, payload["social_credit"])
-        status = self._deserialize_status(typing.cast(data_binding.JSONObject, payload["status"]))
         bio = typing.cast(str | None, payload.get("bio"))
         avatar = typing.cast(int | None, payload.get("avatar"))
         banner = typing.cast(int | None, payload.get("banner"))
-        badges = typing.cast(int, payload["badges"])
-        permissions = typing.cast(int, payload["permissions"])
         email = typing.cast(str | None, payload.get("email"))
         verified = typing.cast(bool | None, payload.get("verified"))
 
@@ -228,7 +244,7 @@ class EntityFactory(entity_factory_trait.EntityFactory):
             username=username,
             display_name=display_name,
             social_credit=social_credit,
-            status=status,
+            status=self._deserialize_status(status),
             bio=bio,
             avatar=avatar,
             banner=banner,
@@ -239,8 +255,12 @@ class EntityFactory(entity_factory_trait.EntityFactory):
         )
 
     def deserialize_authenticated(self, payload: data_binding.JSONObject) -> models.Authenticated:
-        user = self.deserialize_user(typing.cast(data_binding.JSONObject, payload["user"]))
-        users = typing.cast(list[models.User], payload["users"])
+        deserialize_user = self.deserialize_user
+        user = deserialize_user(typing.cast(data_binding.JSONObject, payload["user"]))
+        users = [
+            deserialize_user(typing.cast(data_binding.JSONObject, user_payload))
+            for user_payload in typing.cast(data_binding.JSONArray, payload["users"])
+        ]
 
         return models.Authenticated(user=user, users=users)
 
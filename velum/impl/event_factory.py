@@ -16,10 +16,26 @@ __all__: typing.Sequence[str] = ("EventFactory",)
 
 
 class EventFactory(event_factory_trait.EventFactory):
-    __slots__ = ("_entity_factory",)
+    __slots__ = (
+        "_entity_factory",
+        "_deserialize_authenticated",
+        "_deserialize_hello",
+        "_deserialize_message",
+        "_deserialize_presence_update",
+        "_deserialize_ratelimit",
+        "_deserialize_user",
+    )
 
     def __init__(self, entity_factory: entity_factory_trait.EntityFactory) -> None:
         self._entity_factory = entity_factory
+        # Bind the deserializers ahead of time, so that handling an event only
+        # takes a single attribute lookup to get to its deserializer.
+        self._deserialize_authenticated = entity_factory.deserialize_authenticated
+        self._deserialize_hello = entity_factory.deserialize_hello
+        self._deserialize_message = entity_factory.deserialize_message
+        self._deserialize_presence_update = entity_factory.deserialize_presence_update
+        self._deserialize_ratelimit = entity_factory.deserialize_ratelimit
+        self._deserialize_user = entity_factory.deserialize_user
 
     def deserialize_ratelimit_event(
         self,
@@ -27,7 +43,7 @@ class EventFactory(event_factory_trait.EventFactory):
         payload: data_binding.JSONObject,
     ) -> connection_events.RatelimitEvent:
         return connection_events.RatelimitEvent(
-            data=self._entity_factory.deserialize_ratelimit(payload),
+            self._deserialize_ratelimit(payload),
         )
 
     def deserialize_hello_event(
@@ -35,16 +51,14 @@ class EventFactory(event_factory_trait.EventFactory):
         gateway_connection: gateway_trait.GatewayHandler,  # noqa: ARG002
         payload: data_binding.JSONObject,
     ) -> connection_events.HelloEvent:
-        return connection_events.HelloEvent(data=self._entity_factory.deserialize_hello(payload))
+        return connection_events.HelloEvent(self._deserialize_hello(payload))
 
     def deserialize_message_create_event(
         self,
         gateway_connection: gateway_trait.GatewayHandler,  # noqa: ARG002
         payload: data_binding.JSONObject,
     ) -> message_events.MessageCreateEvent:
-        return message_events.MessageCreateEvent(
-            message=self._entity_factory.deserialize_message(payload),
-        )
+        return message_events.MessageCreateEvent(self._deserialize_message(payload))
 
     def deserialize_authenticated_event(
         self,
@@ -52,7 +66,7 @@ class EventFactory(event_factory_trait.EventFactory):
         payload: data_binding.JSONObject,
     ) -> connection_events.AuthenticatedEvent:
         return connection_events.AuthenticatedEvent(
-            data=self._entity_factory.deserialize_authenticated(payload),
+            self._deserialize_authenticated(payload),
         )
 
     def deserialize_user_update_event(
@@ -60,7 +74,7 @@ class EventFactory(event_factory_trait.EventFactory):
         gateway_connection: gateway_trait.GatewayHandler,  # noqa: ARG002
         payload: data_binding.JSONObject,
     ) -> user_events.UserUpdateEvent:
-        return user_events.UserUpdateEvent(user=self._entity_factory.deserialize_user(payload))
+        return user_events.UserUpdateEvent(self._deserialize_user(payload))
 
     def deserialize_presence_update_event(
         self,
@@ -68,5 +82,5 @@ class EventFactory(event_factory_trait.EventFactory):
         payload: data_binding.JSONObject,
     ) -> user_events.PresenceUpdateEvent:
         return user_events.PresenceUpdateEvent(
-            data=self._entity_factory.deserialize_presence_update(payload),
+            self._deserialize_presence_update(payload),
         )
@@ -12,20 +12,25 @@ __all__: typing.Sequence[str] = ("EventManager",)
 
 
 class EventManager(event_manager_base.EventManagerBase):
-    __slots__ = ("_event_factory",)
+    __slots__ = ("_event_factory", "_deserialize_message_create_event", "_dispatch_nowait")
 
     def __init__(self, event_factory: event_factory_trait.EventFactory) -> None:
         super().__init__()
         self._event_factory = event_factory
 
+        # Message creation is by far the most common event, so we save some
+        # attribute lookups by binding the methods it uses ahead of time.
+        self._deserialize_message_create_event = event_factory.deserialize_message_create_event
+        self._dispatch_nowait = self.dispatch_nowait
+
     @event_manager_base.is_consumer_for(message_events.MessageCreateEvent)
     async def on_message_create(
         self,
         gateway_connection: gateway_trait.GatewayHandler,
         payload: data_binding.JSONObject,
     ) -> None:
-        await self.dispatch(
-            self._event_factory.deserialize_message_create_event(gateway_connection, payload),
+        self._dispatch_nowait(
+            self._deserialize_message_create_event(gateway_connection, payload),
         )
 
     @event_manager_base.is_consumer_for(connection_events.HelloEvent)
@@ -34,7 +39,7 @@ class EventManager(event_manager_base.EventManagerBase):
         gateway_connection: gateway_trait.GatewayHandler,
         payload: data_binding.JSONObject,
     ) -> None:
-        await self.dispatch(
+        self.dispatch_nowait(
             self._event_factory.deserialize_hello_event(gateway_connection, payload),
         )
 
@@ -44,7 +49,7 @@ class EventManager(event_manager_base.EventManagerBase):
         gateway_connection: gateway_trait.GatewayHandler,
         payload: data_binding.JSONObject,
     ) -> None:
-        await self.dispatch(
+        self.dispatch_nowait(
             self._event_factory.deserialize_ratelimit_event(gateway_connection, payload),
         )
 
@@ -54,7 +59,7 @@ class EventManager(event_manager_base.EventManagerBase):
         gateway_connection: gateway_trait.GatewayHandler,
         payload: data_binding.JSONObject,
     ) -> None:
-        await self.dispatch(
+        self.dispatch_nowait(
             self._event_factory.deserialize_authenticated_event(gateway_connection, payload),
         )
 
@@ -64,7 +69,7 @@ class EventManager(event_manager_base.EventManagerBase):
         gateway_connection: gateway_trait.GatewayHandler,
         payload: data_binding.JSONObject,
     ) -> None:
-        await self.dispatch(
+        self.dispatch_nowait(
             self._event_factory.deserialize_user_update_event(gateway_connection, payload),
         )
 
@@ -74,6 +79,6 @@ class EventManager(event_manager_base.EventManagerBase):
         gateway_connection: gateway_trait.GatewayHandler,
         payload: data_binding.JSONObject,
     ) -> None:
-        await self.dispatch(
+        self.dispatch_nowait(
             self._event_factory.deserialize_presence_update_event(gateway_connection, payload),
         )
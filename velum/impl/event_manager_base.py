@@ -6,8 +6,6 @@ import logging
 import types
 import typing
 
-import attr
-
 from velum.api import event_manager_trait
 from velum.api import gateway_trait
 from velum.events import base_events
@@ -29,7 +27,11 @@ __all__: typing.Sequence[str] = (
 if typing.TYPE_CHECKING:
     _ListenerMapT = dict[
         type[base_events.EventT],
-        list[base_events.EventCallbackT[base_events.EventT]],
+        tuple[base_events.EventCallbackT[base_events.EventT], ...],
+    ]
+    _ListenerCacheT = dict[
+        type[base_events.EventT],
+        tuple[base_events.EventCallbackT[base_events.EventT], ...],
     ]
     _WaiterPairT = tuple[
         event_manager_trait.EventPredicateT[base_events.EventT] | None,
@@ -37,7 +39,7 @@ if typing.TYPE_CHECKING:
     ]
     _WaiterMapT = dict[
         type[base_events.EventT],
-        set[_WaiterPairT[base_events.EventT]],
+        list[_WaiterPairT[base_events.EventT]],
     ]
     ConsumerCallback = typing.Callable[
         [gateway_trait.GatewayHandler, data_binding.JSONObject],
@@ -64,23 +66,22 @@ def _is_exception_event(
     return False
 
 
-@attr.define(weakref_slot=False)
 class Consumer(typing.Generic[_EventManagerT]):
-    callback: UnboundConsumerCallback[_EventManagerT] = attr.field(hash=True)
+    __slots__: typing.Sequence[str] = ("callback", "events_bitmask")
+
+    callback: UnboundConsumerCallback[_EventManagerT]
     """The callback function for this consumer."""
 
-    events_bitmask: int = attr.field()
+    events_bitmask: int
     """The registered events bitmask."""
 
-    listener_group_count: int = attr.field(init=False, default=0)
-    """The number of listener groups registered to this consumer."""
-
-    waiter_group_count: int = attr.field(init=False, default=0)
-    """The number of waiters groups registered to this consumer."""
-
-    @property
-    def is_enabled(self) -> bool:
-        return self.listener_group_count > 0 or self.waiter_group_count > 0
+    def __init__(
+        self,
+        callback: UnboundConsumerCallback[_EventManagerT],
+        events_bitmask: int,
+    ) -> None:
+        self.callback = callback
+        self.events_bitmask = events_bitmask
 
     @typing.overload
     def __get__(self, instance: None, owner: type[typing.Any]) -> typing_extensions.Self:
@@ -131,39 +132,51 @@ def is_consumer_for(
     return wrapper
 
 
-@attr.define(weakref_slot=False)
+@typing.final
 class _BoundConsumer(typing.Generic[_EventManagerT]):
-    event_manager: event_manager_trait.EventManager = attr.field()
-
-    consumer: Consumer[_EventManagerT] = attr.field()
-
-    @property
-    def callback(self) -> UnboundConsumerCallback[_EventManagerT]:
-        return self.consumer.callback
-
-    @property
-    def events_bitmask(self) -> int:
-        return self.consumer.events_bitmask
-
-    @property
-    def listener_group_count(self) -> int:
-        return self.consumer.listener_group_count
+    # The consumer's fields are copied rather than forwarded to, as they are
+    # read for every gateway event. The group counts are tracked per event
+    # manager instance, as the unbound consumer is shared by all of them.
+    __slots__: typing.Sequence[str] = (
+        "event_manager",
+        "consumer",
+        "callback",
+        "events_bitmask",
+        "listener_group_count",
+        "waiter_group_count",
+        "task_name",
+    )
+
+    event_manager: event_manager_trait.EventManager
+    consumer: Consumer[_EventManagerT]
+    callback: UnboundConsumerCallback[_EventManagerT]
+    events_bitmask: int
+
+    listener_group_count: int
+    """The number of listener groups registered to this consumer."""
 
-    @listener_group_count.setter
-    def listener_group_count(self, value: int) -> None:
-        self.consumer.listener_group_count = value
+    waiter_group_count: int
+    """The number of waiters groups registered to this consumer."""
 
-    @property
-    def waiter_group_count(self) -> int:
-        return self.consumer.waiter_group_count
+    task_name: str
+    """The name of the tasks that run this consumer."""
 
-    @waiter_group_count.setter
-    def waiter_group_count(self, value: int) -> None:
-        self.consumer.waiter_group_count = value
+    def __init__(
+        self,
+        event_manager: event_manager_trait.EventManager,
+        consumer: Consumer[_EventManagerT],
+    ) -> None:
+        self.event_manager = event_manager
+        self.consumer = consumer
+        self.callback = consumer.callback
+        self.events_bitmask = consumer.events_bitmask
+        self.listener_group_count = 0
+        self.waiter_group_count = 0
+        self.task_name = f"dispatch {consumer.callback.__name__}"
 
     @property
     def is_enabled(self) -> bool:
-        return self.consumer.is_enabled
+        return self.listener_group_count > 0 or self.waiter_group_count > 0
 
     async def __call__(
         self,
@@ -174,26 +187,66 @@ class _BoundConsumer(typing.Generic[_EventManagerT]):
 
 
 class EventManagerBase(event_manager_trait.EventManager):
-    __slots__ = ("_consumers", "_listeners", "_waiters")
-
+    __slots__ = (
+        "_completed_future",
+        "_consumers",
+        "_consumers_by_bit",
+        "_listeners",
+        "_listener_cache",
+        "_waiters",
+    )
+
+    _unbound_consumers: typing.ClassVar[dict[str, Consumer[typing.Any]]] = {}
     _consumers: dict[str, _BoundConsumer[typing_extensions.Self]]
+    _consumers_by_bit: dict[int, tuple[_BoundConsumer[typing_extensions.Self], ...]]
     _waiters: _WaiterMapT[base_events.Event]
     _listeners: _ListenerMapT[base_events.Event]
+    _listener_cache: _ListenerCacheT[base_events.Event]
+    _completed_future: asyncio.Future[None] | None
+
+    def __init_subclass__(cls) -> None:
+        super().__init_subclass__()
+
+        # Consumers are collected once per class rather than once per
+        # instance, so that creating an event manager need not inspect it.
+        consumers: dict[str, Consumer[typing.Any]] = {}
+        for base in reversed(cls.__mro__):
+            for name, member in vars(base).items():
+                if not name.startswith("on_"):
+                    continue
+
+                # Key consumers by the opcode as sent by the gateway, such that
+                # no string transformations are needed when consuming events.
+                event_name = name[3:].upper()
+                if isinstance(member, Consumer):
+                    consumers[event_name] = member
+                else:
+                    # Overridden by something that isn't a consumer.
+                    consumers.pop(event_name, None)
+
+        cls._unbound_consumers = consumers
 
     def __init__(self) -> None:
-        self._consumers = {}
+        self._consumers = {
+            event_name: _BoundConsumer(self, consumer)
+            for event_name, consumer in self._unbound_consumers.items()
+        }
+
+        # Event type bitmasks are single bits, so index the consumers by every
+        # bit in their bitmask to look up the consumers of an event type.
+        consumers_by_bit: dict[int, tuple[_BoundConsumer[typing_extensions.Self], ...]] = {}
+        for consumer in self._consumers.values():
+            bitmask = consumer.events_bitmask
+            while bitmask:
+                bit = bitmask & -bitmask
+                consumers_by_bit[bit] = (*consumers_by_bit.get(bit, ()), consumer)
+                bitmask ^= bit
+
+        self._consumers_by_bit = consumers_by_bit
         self._listeners = {}
+        self._listener_cache = {}
         self._waiters = {}
-
-        for name, member in inspect.getmembers(self):
-            if not name.startswith("on_"):
-                continue
-
-            event_name = name[3:]
-            if not isinstance(member, _BoundConsumer):
-                continue
-
-            self._consumers[event_name] = member  # pyright: ignore
+        self._completed_future = None
 
     async def _invoke_callback(
         self,
@@ -230,19 +283,15 @@ class EventManagerBase(event_manager_trait.EventManager):
         gateway_connection: gateway_trait.GatewayHandler,
         payload: data_binding.JSONObject,
     ) -> None:
-        if not consumer.is_enabled:
-            _LOGGER.debug(
-                "Skipping raw dispatch for event '%s' because it has no registered listeners.",
-                consumer.callback.__name__,
-            )
-            return
-
         try:
-            _LOGGER.debug(
-                "Dispatching event '%s'.",
-                consumer.callback.__name__,
-            )
-            await consumer(gateway_connection, payload)
+            # Resolving the consumer name for logging is relatively costly, and
+            # this runs for every dispatched gateway event.
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "Dispatching event '%s'.",
+                    consumer.callback.__name__,
+                )
+            await consumer.callback(consumer.event_manager, gateway_connection, payload)
         except asyncio.CancelledError:
             # Can be safely skipped, most likely caused by shutting down event loop.
             return
@@ -261,20 +310,16 @@ class EventManagerBase(event_manager_trait.EventManager):
         event_type: type[base_events.Event],
         count: typing.Literal[-1, 1],
     ) -> None:
-        event_bitmask = event_type.bitmask
-        for consumer in self._consumers.values():
-            if (consumer.events_bitmask & event_bitmask) == event_bitmask:
-                consumer.listener_group_count += count
+        for consumer in self._consumers_by_bit.get(event_type.bitmask, ()):
+            consumer.listener_group_count += count
 
     def _increment_waiter_group_count(
         self,
         event_type: type[base_events.Event],
         count: typing.Literal[-1, 1],
     ) -> None:
-        event_bitmask = event_type.bitmask
-        for consumer in self._consumers.values():
-            if (consumer.events_bitmask & event_bitmask) == event_bitmask:
-                consumer.waiter_group_count += count
+        for consumer in self._consumers_by_bit.get(event_type.bitmask, ()):
+            consumer.waiter_group_count += count
 
     def consume_raw_event(
         self,
@@ -282,46 +327,118 @@ class EventManagerBase(event_manager_trait.EventManager):
         gateway_connection: gateway_trait.GatewayHandler,
         payload: data_binding.JSONObject,
     ) -> None:
-        consumer = self._consumers.get(event_name.lower())
+        consumer = self._consumers.get(event_name)
+
+        if consumer is None:
+            consumer = self._consumers.get(event_name.upper())
 
-        if not consumer:
-            _LOGGER.warning("Unhandled event: %r", event_name.lower())
+        if consumer is None:
+            _LOGGER.warning("Unhandled event: %r", event_name)
+            return
+
+        # Most event types have nothing listening to them, in which case there
+        # is no need to even create a task to consume them.
+        if not (consumer.listener_group_count or consumer.waiter_group_count):
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "Skipping raw dispatch for event '%s' because it has no registered listeners.",
+                    consumer.callback.__name__,
+                )
             return
 
         async_utils.safe_task(
             self._handle_consumption(consumer, gateway_connection, payload),
-            name=f"dispatch {event_name}",
+            name=consumer.task_name,
         )
 
-    def dispatch(self, event: base_events.Event) -> asyncio.Future[typing.Any]:
-        tasks: list[typing.Coroutine[None, typing.Any, None]] = []
+    def _get_polymorphic_listeners(
+        self,
+        event_type: type[base_events.EventT],
+    ) -> tuple[base_events.EventCallbackT[base_events.EventT], ...]:
+        # Listeners for an event type and all its parent event types are cached
+        # until a listener is (un)subscribed, so that dispatching does not need
+        # to walk all dispatched event types every time.
+        try:
+            return self._listener_cache[event_type]  # pyright: ignore
+        except KeyError:
+            pass
 
-        for cls in event.dispatches:
-            for callback in self._listeners.get(cls, ()):
-                tasks.append(self._invoke_callback(callback, event))  # noqa: PERF401
+        listeners: list[base_events.EventCallbackT[base_events.EventT]] = []
+        for event in event_type.dispatches:
+            if subscribed_listeners := self._listeners.get(event):
+                listeners.extend(subscribed_listeners)
+
+        cached = self._listener_cache[event_type] = tuple(listeners)  # pyright: ignore
+        return cached  # pyright: ignore
 
-            if cls not in self._waiters:
+    def _resolve_waiters(self, event: base_events.Event) -> None:
+        if not self._waiters:
+            # Waiters are rare; don't walk the dispatched event types for nothing.
+            return
+
+        for cls in event.dispatches:
+            waiters = self._waiters.get(cls)
+            if waiters is None:
                 continue
 
-            waiter_set = self._waiters[cls]
-            for waiter in tuple(waiter_set):
+            # Rather than removing resolved waiters one by one, the waiters that
+            # are still waiting are collected and swapped in all at once.
+            remaining: list[_WaiterPairT[base_events.Event]] = []
+            for waiter in waiters:
                 predicate, future = waiter
                 if not future.done():
                     try:
                         if predicate and not predicate(event):
+                            remaining.append(waiter)
                             continue
                     except Exception as ex:  # noqa: BLE001
                         future.set_exception(ex)
                     else:
                         future.set_result(event)
 
-                waiter_set.remove(waiter)
-
-            if not waiter_set:
+            if remaining:
+                # Updated in place, as pending `wait_for` calls hold on to it.
+                waiters[:] = remaining
+            else:
                 del self._waiters[cls]
                 self._increment_waiter_group_count(cls, -1)
 
-        return asyncio.gather(*tasks) if tasks else async_utils.create_completed_future()
+    def _get_completed_future(self) -> asyncio.Future[None]:
+        # A completed future can safely be shared between dispatches, so we
+        # only create a new one if the event loop changed.
+        loop = asyncio.get_running_loop()
+        future = self._completed_future
+
+        if future is None or future.get_loop() is not loop:
+            future = self._completed_future = loop.create_future()
+            future.set_result(None)
+
+        return future
+
+    def dispatch(self, event: base_events.Event) -> asyncio.Future[typing.Any]:
+        self._resolve_waiters(event)
+
+        listeners = self._get_polymorphic_listeners(type(event))
+        if not listeners:
+            return self._get_completed_future()
+
+        if len(listeners) == 1:
+            # A single listener's task can be awaited directly, without having
+            # gather wrap it in another future.
+            return async_utils.safe_task(self._invoke_callback(listeners[0], event))
+
+        return asyncio.gather(*(self._invoke_callback(callback, event) for callback in listeners))
+
+    def dispatch_nowait(self, event: base_events.Event) -> None:
+        """Dispatch an event without returning a future to await its listeners.
+
+        This avoids creating the gathering future that ``dispatch`` returns,
+        and should be preferred whenever that future would not be awaited.
+        """
+        for callback in self._get_polymorphic_listeners(type(event)):
+            async_utils.safe_task(self._invoke_callback(callback, event))
+
+        self._resolve_waiters(event)
 
     def subscribe(
         self,
@@ -332,20 +449,26 @@ class EventManagerBase(event_manager_trait.EventManager):
             msg = f"Cannot subscribe to non-coroutine function '{callback.__name__}'."
             raise TypeError(msg)
 
-        _LOGGER.debug(
-            "Subscribing callback '%s%s' to event-type '%s.%s'.",
-            callback.__name__,
-            inspect.signature(callback),
-            event_type.__module__,
-            event_type.__qualname__,
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            # Only introspect the signature if it is actually going to be logged.
+            _LOGGER.debug(
+                "Subscribing callback '%s%s' to event-type '%s.%s'.",
+                callback.__name__,
+                inspect.signature(callback),
+                event_type.__module__,
+                event_type.__qualname__,
+            )
 
+        # Listeners are stored as tuples that are replaced on every change,
+        # such that they can be handed out and iterated without copying.
         try:
-            self._listeners[event_type].append(callback)  # type: ignore
+            self._listeners[event_type] += (callback,)  # type: ignore
         except KeyError:
-            self._listeners[event_type] = [callback]  # type: ignore
+            self._listeners[event_type] = (callback,)  # type: ignore
             self._increment_listener_group_count(event_type, 1)
 
+        self._listener_cache.clear()
+
     def unsubscribe(
         self,
         event_type: type[base_events.EventT],
@@ -355,17 +478,23 @@ class EventManagerBase(event_manager_trait.EventManager):
         if not listeners:
             return
 
-        _LOGGER.debug(
-            "Unsubscribing callback '%s%s' from event-type '%s.%s'.",
-            callback.__name__,
-            inspect.signature(callback),
-            event_type.__module__,
-            event_type.__qualname__,
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            # Only introspect the signature if it is actually going to be logged.
+            _LOGGER.debug(
+                "Unsubscribing callback '%s%s' from event-type '%s.%s'.",
+                callback.__name__,
+                inspect.signature(callback),
+                event_type.__module__,
+                event_type.__qualname__,
+            )
 
-        listeners.remove(callback)  # type: ignore
+        index = listeners.index(callback)  # type: ignore
+        listeners = listeners[:index] + listeners[index + 1 :]
+        self._listener_cache.clear()
 
-        if not listeners:
+        if listeners:
+            self._listeners[event_type] = listeners
+        else:
             # Last listener for this event type was removed
             del self._listeners[event_type]
             self._increment_listener_group_count(event_type, -1)
@@ -378,17 +507,9 @@ class EventManagerBase(event_manager_trait.EventManager):
         polymorphic: bool = True,
     ) -> typing.Collection[base_events.EventCallbackT[base_events.EventT]]:
         if polymorphic:
-            listeners: list[base_events.EventCallbackT[base_events.EventT]] = []
-            for event in event_type.dispatches:
-                if subscribed_listeners := self._listeners.get(event):
-                    listeners.extend(subscribed_listeners)
-
-            return listeners
-
-        if items := self._listeners.get(event_type):
-            return items.copy()
+            return self._get_polymorphic_listeners(event_type)
 
-        return ()
+        return self._listeners.get(event_type, ())
 
     def listen(
         self,
@@ -451,19 +572,19 @@ class EventManagerBase(event_manager_trait.EventManager):
         assert issubclass(event_type, base_events.Event)
 
         try:
-            waiter_set = self._waiters[event_type]
+            waiters = self._waiters[event_type]
         except KeyError:
-            waiter_set = self._waiters[event_type] = set[_WaiterPairT[base_events.Event]]()
+            waiters = self._waiters[event_type] = []
             self._increment_waiter_group_count(event_type, 1)
 
         pair = (predicate, future)
 
-        waiter_set.add(pair)  # pyright: ignore[reportGeneralTypeIssues]
+        waiters.append(pair)  # pyright: ignore[reportGeneralTypeIssues]
         try:
             return await asyncio.wait_for(future, timeout=timeout)
         except asyncio.TimeoutError:
-            waiter_set.remove(pair)  # pyright: ignore[reportGeneralTypeIssues]
-            if not waiter_set:
+            waiters.remove(pair)  # pyright: ignore[reportGeneralTypeIssues]
+            if not waiters:
                 del self._waiters[event_type]
                 self._increment_waiter_group_count(event_type, -1)
 
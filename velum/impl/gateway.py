@@ -142,7 +142,7 @@ class GatewayWebsocket:
         await self._ws.send_str(payload)
 
     async def receive_json(self) -> data_binding.JSONObject:
-        payload = await self._receive_and_validate_text()
+        payload = await self._receive_and_validate_payload()
 
         if self._logger.isEnabledFor(logging.DEBUG):
             self._logger.debug("Received payload with size %s:\n\t%s", len(payload), payload)
@@ -152,27 +152,25 @@ class GatewayWebsocket:
 
         return data
 
-    async def _receive_and_validate_text(self) -> str:
+    async def _receive_and_validate_payload(self) -> str | bytes:
         message = typing.cast("_WSMessage", await self._ws.receive())
 
         if message.type == aiohttp.WSMsgType.TEXT:
             assert isinstance(message.data, str)
             return message.data
 
+        if message.type == aiohttp.WSMsgType.BINARY:
+            # Both JSON implementations load bytes directly, so there is no
+            # need to decode the payload to a string first.
+            assert isinstance(message.data, bytes)
+            return message.data
+
         self._raise_for_unhandled_message(message)
         return None
 
     # TODO: implement zlib whenever eludris does
 
     def _raise_for_unhandled_message(self, message: _WSMessage) -> typing.NoReturn:
-        if message.type == aiohttp.WSMsgType.TEXT:
-            msg = "Unexpected message type: received TEXT, expected BINARY."
-            raise errors.GatewayError(msg)
-
-        if message.type == aiohttp.WSMsgType.BINARY:
-            msg = "Unexpected message type: received BINARY, expected TEXT."
-            raise errors.GatewayError(msg)
-
         if message.type == aiohttp.WSMsgType.CLOSE:
             assert message.data is not None
             assert message.extra is not None
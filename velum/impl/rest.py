@@ -22,6 +22,12 @@ _REST_URL: typing.Final[str] = "https://api.eludris.gay/"
 _CDN_URL: typing.Final[str] = "https://cdn.eludris.gay/"
 _APPLICATION_JSON: typing.Final[str] = "application/json"
 
+# Connection pool settings.
+_CONNECTION_LIMIT: typing.Final[int] = 100
+_CONNECTION_LIMIT_PER_HOST: typing.Final[int] = 32
+_KEEPALIVE_TIMEOUT: typing.Final[float] = 75.0
+_DNS_CACHE_TTL: typing.Final[int] = 300
+
 
 class RESTClient(rest_trait.RESTClient):
     __slots__ = (
@@ -71,7 +77,19 @@ class RESTClient(rest_trait.RESTClient):
             msg = "Cannot start an already running RESTClient."
             raise RuntimeError(msg)
 
-        self._session = aiohttp.ClientSession(json_serialize=data_binding.dump_json)
+        # Keep connections alive between requests such that consecutive requests
+        # to the same host do not need to go through the TCP/TLS handshake again.
+        # aiohttp already sets TCP_NODELAY on every connection it opens.
+        connector = aiohttp.TCPConnector(
+            limit=_CONNECTION_LIMIT,
+            limit_per_host=_CONNECTION_LIMIT_PER_HOST,
+            keepalive_timeout=_KEEPALIVE_TIMEOUT,
+            ttl_dns_cache=_DNS_CACHE_TTL,
+        )
+        self._session = aiohttp.ClientSession(
+            connector=connector,
+            json_serialize=data_binding.dump_json,
+        )
 
     async def close(self) -> None:
         await self._assert_and_return_session().close()
@@ -179,7 +197,8 @@ class RESTClient(rest_trait.RESTClient):
 
     async def fetch_file_from_bucket(self, bucket: str, /, id: int) -> files.URL:  # noqa: A002
         url = self._complete_route(routes.GET_FILE.compile(bucket=bucket, id=id))
-        return files.URL(url)
+        # Stream the file through this client's connection pool while it is alive.
+        return files.URL(url, session=self._session)
 
     async def fetch_attachment(self, id: int) -> files.URL:  # noqa: A002
         return await self.fetch_file_from_bucket("attachments", id)
@@ -201,7 +220,7 @@ class RESTClient(rest_trait.RESTClient):
 
     async def fetch_static_file(self, name: str) -> files.URL:
         url = self._complete_route(routes.GET_FILE_INFO.compile(name=name))
-        return files.URL(url)
+        return files.URL(url, session=self._session)
 
     # Instance.
 
@@ -1,5 +1,4 @@
 import asyncio
-import contextlib
 import inspect
 import typing
 
@@ -25,22 +24,40 @@ def create_completed_future(
 
 
 async def cancel_futures(futures: typing.Iterable[asyncio.Future[typing.Any]]) -> None:
-    for future in futures:
-        if not future.done() and not future.cancelled():
-            future.cancel()
-            with contextlib.suppress(asyncio.CancelledError):
-                await future
+    pending = [future for future in futures if not future.done()]
+    if not pending:
+        return
+
+    # Cancel everything up-front so that all futures can wind down within the
+    # same event loop iteration, instead of awaiting them one by one.
+    for future in pending:
+        future.cancel()
+
+    await asyncio.gather(*pending, return_exceptions=True)
 
 
 async def first_completed(
     *awaitables: typing.Awaitable[typing.Any],
     timeout: float | None = None,
 ) -> None:
-    futures = tuple(map(asyncio.ensure_future, awaitables))
-    iter_ = asyncio.as_completed(futures, timeout=timeout)
+    futures = tuple(
+        awaitable if isinstance(awaitable, asyncio.Future) else asyncio.ensure_future(awaitable)
+        for awaitable in awaitables
+    )
 
     try:
-        await next(iter_)
+        done, _ = await asyncio.wait(
+            futures,
+            timeout=timeout,
+            return_when=asyncio.FIRST_COMPLETED,
+        )
+
+        if not done:
+            raise asyncio.TimeoutError
+
+        # Propagate the result (or exception) of the first completed future.
+        next(iter(done)).result()
+
     finally:
         await cancel_futures(futures)
 
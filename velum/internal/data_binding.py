@@ -77,7 +77,10 @@ class JSONImpl(enum.Enum):
     """The standard-library JSON implementation."""
 
     ORJSON = enum.auto()
-    """A faster JSON implementation that comes installed with ``velum[speedups]``."""
+    """A faster JSON implementation that comes installed with ``velum[speedups]``.
+
+    This is used by default if it is installed.
+    """
 
 
 @typing.overload
@@ -140,8 +143,12 @@ def set_json_impl(
             raise ImportError(msg) from exc
 
         else:
+            # Match the stdlib in allowing non-str dict keys, which orjson
+            # rejects by default.
+            option = orjson.OPT_NON_STR_KEYS
+
             load_json = orjson.loads
-            dump_json = lambda obj: orjson.dumps(obj).decode()  # noqa: E731
+            dump_json = lambda obj: orjson.dumps(obj, option=option).decode()  # noqa: E731
             JSONDecodeError = orjson.JSONDecodeError
             return
 
@@ -152,9 +159,13 @@ def set_json_impl(
     raise TypeError(msg)
 
 
-# Set the stdlib `json` module as the default implementation
+# Set orjson as the default implementation if it is installed, and fall back
+# to the stdlib `json` module otherwise.
 
-set_json_impl(impl=JSONImpl.JSON)
+try:
+    set_json_impl(impl=JSONImpl.ORJSON)
+except ImportError:
+    set_json_impl(impl=JSONImpl.JSON)
 
 
 # Builders
@@ -196,6 +207,8 @@ class FormBuilder:
 
         for name, resource in self._resources:
             stream = await stack.enter_async_context(resource.stream(executor=self._executor))
+            # The reader is an async iterable, which aiohttp streams to the
+            # socket chunk-by-chunk rather than buffering it in its entirety.
             form.add_field(name, stream, filename=stream.filename)
 
         return form
@@ -1,13 +1,11 @@
 from __future__ import annotations
 
+import ipaddress
 import typing
 from enum import Enum
 
 import attr
 
-if typing.TYPE_CHECKING:
-    import ipaddress
-
 __all__: typing.Sequence[str] = (
     "Message",
     "InstanceInfo",
@@ -252,9 +250,26 @@ class Session:
     client: str
     """The client the session was created by."""
 
-    ip: ipaddress.IPv4Address | ipaddress.IPv6Address
+    ip: str
     """The IP address the session was created from."""
 
+    # Parsing is deferred until the address is first accessed, as most sessions
+    # are never inspected that closely.
+    _ip_address: ipaddress.IPv4Address | ipaddress.IPv6Address | None = attr.field(
+        default=None,
+        init=False,
+        repr=False,
+        eq=False,
+    )
+
+    @property
+    def ip_address(self) -> ipaddress.IPv4Address | ipaddress.IPv6Address:
+        """The IP address the session was created from, parsed into an address object."""
+        if self._ip_address is None:
+            self._ip_address = ipaddress.ip_address(self.ip)
+
+        return self._ip_address
+
 
 class StatusType(str, Enum):
     """Represents the type of a status."""